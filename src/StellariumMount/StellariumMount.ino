@@ -73,6 +73,7 @@ void setup() {
   Serial.println("  AZ,<steps> - Move azimuth motor");
   Serial.println("  AL,<steps> - Move altitude motor");
   Serial.println("  STATUS - Get current position");
+  Serial.println("  S - Get current position (fixed-width)");
   Serial.println("  HOME - Move to home position");
   Serial.println("  STOP - Stop all movement");
   Serial.println("  TEST_AZ - Test azimuth motor only");
@@ -114,7 +115,10 @@ void loop() {
 }
 
 void serialEvent() {
-  while (Serial.available()) {
+  // Read one command at a time: anything after the first newline stays in
+  // the RX buffer until loop() has processed this command, so commands sent
+  // back to back (e.g. "AZ,n\nAL,m\n") are not merged into one line
+  while (Serial.available() && !stringComplete) {
     char inChar = (char)Serial.read();
     inputString += inChar;
     if (inChar == '\n') {
@@ -160,6 +164,16 @@ void processCommand(String command) {
       Serial.println("BOTH");
     }
   }
+  else if (command == "S") {
+    // Report current position as a fixed-width record: S<az><al><az_moving><al_moving>
+    // e.g. "S+00100+0005001" so the host can parse it by slicing
+    // The host takes a valid reply as a sign this sketch reads one command per
+    // loop (see serialEvent) and starts sending commands back to back
+    char record[16];
+    snprintf(record, sizeof(record), "S%+06d%+06d%d%d",
+             azimuthStep, altitudeStep, azimuthMoving ? 1 : 0, altitudeMoving ? 1 : 0);
+    Serial.println(record);
+  }
   else if (command == "HOME") {
     // Move to home position
     moveAzimuthTo(0);
@@ -178,6 +192,7 @@ void processCommand(String command) {
     Serial.println("  AZ,<steps> - Move azimuth motor to step position");
     Serial.println("  AL,<steps> - Move altitude motor to step position");
     Serial.println("  STATUS - Get current position and movement status");
+    Serial.println("  S - Get current position and movement status (fixed-width)");
     Serial.println("  HOME - Move both motors to home position (0,0)");
     Serial.println("  STOP - Stop all movement");
     Serial.println("  TEST_AZ - Test azimuth motor only");
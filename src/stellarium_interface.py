@@ -12,56 +12,224 @@ This script can:
 Requirements:
 - pyserial
 - socket (for Stellarium communication)
+- numpy (optional, for batch coordinate conversion)
+- numba (optional, compiles the batch conversions)
+- pyserial-asyncio (optional, for asynchronous auto-tracking)
 """
 
 import serial
 import socket
+import selectors
+import asyncio
 import time
+import select
 import math
+import platform
+import re
 import threading
+import multiprocessing
+import queue
+from collections import deque
 from typing import Tuple, Optional
 import struct
+import array
+import errno
+
+try:
+    import serial_asyncio
+except ImportError:
+    serial_asyncio = None
+
+# numpy and numba are imported on first use of the batch conversions (see
+# _load_numeric) so the CLI, the listener and its workers start quickly
+np = None
+_deg_to_steps_jit = None
+_float_to_dms_jit = None
+
+# Disable Nagle's algorithm by default: the protocol exchanges tiny
+# line-oriented messages that would otherwise be delayed waiting for ACKs
+DEFAULT_SOCKET_OPTIONS = [(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)]
+
+# Linux serial ioctls and flag (see linux/serial.h) used to turn off the
+# USB-serial driver's latency timer
+TIOCGSERIAL = 0x541E
+TIOCSSERIAL = 0x541F
+ASYNC_LOW_LATENCY = 0x2000
+
+# Matches a legacy STATUS report: "STATUS: AZ=100, AL=50, AZ_MOVING=0, AL_MOVING=0"
+_STATUS_RE = re.compile(r'AZ=(-?\d+),\s*AL=(-?\d+),\s*AZ_MOVING=([01]),\s*AL_MOVING=([01])')
+
+# Size of the reusable socket receive buffers
+RECV_BUFFER_SIZE = 4096
+
+# Seconds of silence after which a Stellarium reply without a trailing
+# newline (e.g. "AZ:123.45,ALT:67.89") is taken as complete
+STELLARIUM_QUIET_TIME = 0.05
+
+# Unsolicited Arduino lines kept per event kind before the oldest are dropped
+EVENT_QUEUE_SIZE = 64
+
+# Packets the listener queues for decoding/printing before dropping new ones
+LOG_QUEUE_SIZE = 1024
+
+# Matches a signed float or integer in a J2000 coordinate string
+_FLOAT_RE = re.compile(r'[-+]?\d*\.\d+|\d+')
+
+# Tag the Arduino puts in front of its reply, by command keyword
+_RESPONSE_TAGS = {
+    'AZ': 'AZIMUTH',
+    'AL': 'ALTITUDE',
+    'STATUS': 'STATUS',
+    'S': 'S',
+    'HOME': 'HOME',
+    'STOP': 'STOP',
+    'TEST_AZ': 'TEST_MODE',
+    'TEST_AL': 'TEST_MODE',
+    'TEST_BOTH': 'TEST_MODE',
+    'TEST_MODE': 'TEST_MODE',
+}
+
+# Tags whose reply ends with "Target reached" rather than after one line
+_AXIS_TAGS = ('AZIMUTH', 'ALTITUDE')
+
+
+def _acknowledged(response: str) -> bool:
+    """Whether a move reply shows the Arduino accepted the new target"""
+    return "Moving to step" in response and "ERROR" not in response
+
+
+def _response_tag(line: str) -> Optional[str]:
+    """Return the tag of an Arduino output line (e.g. "AZIMUTH: Target reached" -> "AZIMUTH")"""
+    if len(line) == 15 and line[0] == 'S' and line[1] in '+-':
+        return 'S'
+    if ':' in line:
+        return line.split(':', 1)[0]
+    return None
+
+
+def apply_socket_options(sock: socket.socket, socket_options=None):
+    """Apply a list of (level, option, value) tuples to a socket"""
+    if socket_options is None:
+        socket_options = DEFAULT_SOCKET_OPTIONS
+    for level, option, value in socket_options:
+        sock.setsockopt(level, option, value)
+
+
+class PendingResponse:
+    """Arduino reply to a command sent with send_command_async"""
+    
+    def __init__(self, tag: Optional[str], seq: int = 0, on_timeout=None):
+        self.tag = tag
+        self.seq = seq
+        self.lines = []
+        self.done = threading.Event()
+        self._on_timeout = on_timeout
+    
+    def is_complete(self, line: str) -> bool:
+        """Whether line ends this reply"""
+        if "ERROR" in line:
+            return True
+        if self.tag in _AXIS_TAGS:
+            return "Target reached" in line
+        # Untagged commands (e.g. HELP) run until the timeout
+        return self.tag is not None
+    
+    def result(self, timeout: Optional[float] = None) -> str:
+        """Wait for the reply and return it; on timeout, return the lines received so far"""
+        if not self.done.wait(timeout) and self._on_timeout:
+            self._on_timeout(self)
+        return "\n".join(self.lines)
+
 
 class StellariumMountInterface:
-    def __init__(self, arduino_port: str = 'COM3', baud_rate: int = 9600):
+    def __init__(self, arduino_port: str = 'COM3', baud_rate: int = 9600, low_latency: bool = True,
+                 compact_status: bool = True):
         """
         Initialize the mount interface
         
         Args:
             arduino_port: Serial port for Arduino (e.g., 'COM3' on Windows, '/dev/ttyUSB0' on Linux)
             baud_rate: Serial communication baud rate
+            low_latency: Ask the USB-serial driver to deliver bytes immediately
+                instead of batching them behind its latency timer (Linux)
+            compact_status: Poll status with the fixed-width "S" command instead of
+                the legacy "STATUS" text report
         """
         self.arduino_port = arduino_port
         self.baud_rate = baud_rate
+        self.low_latency = low_latency
+        self.compact_status = compact_status
+        # Set once the Arduino answers "S": that sketch also reads one command
+        # per loop, so AZ and AL can be sent back to back
+        self._pipelining = False
         self.serial_conn = None
         self.connected = False
         
+        # Replies awaited by send_command_async, by response tag, oldest first
+        self._pending = {}
+        self._pending_lock = threading.Lock()
+        self._pending_seq = 0
+        self._reader_thread = None
+        
+        # Unsolicited Arduino output (e.g. a late "Target reached"), by response tag
+        self._events = {}
+        
         # Motor parameters (matching Arduino code)
         self.STEPS_PER_REVOLUTION = 2048
         self.AZIMUTH_MAX_STEPS = self.STEPS_PER_REVOLUTION
         self.ALTITUDE_MAX_STEPS = self.STEPS_PER_REVOLUTION // 2
         
+        # Precomputed scale factors (azimuth spans 360 degrees, altitude 90)
+        self._az_steps_per_deg = self.AZIMUTH_MAX_STEPS / 360.0
+        self._alt_steps_per_deg = self.ALTITUDE_MAX_STEPS / 90.0
+        self._az_deg_per_step = 360.0 / self.AZIMUTH_MAX_STEPS
+        self._alt_deg_per_step = 90.0 / self.ALTITUDE_MAX_STEPS
+        
+        # Seconds to block waiting for each line of an Arduino response
+        self.RESPONSE_TIMEOUT = 2
+        
+        # Seconds a status reply is reused before the Arduino is polled again
+        self.STATUS_CACHE_TTL = 0.1
+        
         # Current position tracking
         self.current_azimuth_steps = 0
         self.current_altitude_steps = 0
         self.azimuth_moving = False
         self.altitude_moving = False
+        self._status_cache = None
+        self._status_ts = 0.0
+        
+        # Step targets last sent by move_to_coordinates (None forces the next move)
+        self._last_az_cmd = None
+        self._last_alt_cmd = None
         
         # Stellarium connection
         self.stellarium_socket = None
         self.stellarium_connected = False
+        self._rx = bytearray(RECV_BUFFER_SIZE)
+        self._rx_view = memoryview(self._rx)
+        # Bytes received from Stellarium since the last newline
+        self._stellarium_buf = bytearray()
         
     def connect_arduino(self) -> bool:
         """Connect to Arduino via serial"""
         try:
-            self.serial_conn = serial.Serial(self.arduino_port, self.baud_rate, timeout=1)
+            self.serial_conn = serial.Serial(self.arduino_port, self.baud_rate,
+                                             timeout=self.RESPONSE_TIMEOUT)
+            if self.low_latency:
+                self.enable_low_latency()
             time.sleep(2)  # Wait for Arduino to reset
             self.connected = True
+            self._last_az_cmd = self._last_alt_cmd = None
             print(f"Connected to Arduino on {self.arduino_port}")
             
             # Clear any pending data
             self.serial_conn.reset_input_buffer()
             
+            # Hand incoming lines to whichever command is waiting for them
+            self._reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+            self._reader_thread.start()
+            
             # Get initial status
             self.get_status()
             return True
@@ -71,62 +239,162 @@ class StellariumMountInterface:
             self.connected = False
             return False
     
+    def enable_low_latency(self) -> bool:
+        """
+        Disable the USB-serial driver's latency timer on the open port (Linux only)
+        
+        On Windows the FTDI latency timer is a driver setting (Device Manager >
+        Port Settings > Advanced), so this returns False there.
+        """
+        if platform.system() != 'Linux':
+            return False
+        try:
+            import fcntl
+            # struct serial_struct: flags is the fifth int field
+            buf = array.array('i', [0] * 32)
+            fcntl.ioctl(self.serial_conn.fileno(), TIOCGSERIAL, buf)
+            buf[4] |= ASYNC_LOW_LATENCY
+            fcntl.ioctl(self.serial_conn.fileno(), TIOCSSERIAL, buf)
+            return True
+        except OSError as e:
+            # ptys and some CDC adapters don't implement the ioctl; nothing to tune there
+            if e.errno not in (errno.ENOTTY, errno.EINVAL):
+                print(f"Could not enable low latency mode: {e}")
+        except (ValueError, serial.SerialException) as e:
+            print(f"Could not enable low latency mode: {e}")
+        return False
+    
     def disconnect_arduino(self):
         """Disconnect from Arduino"""
+        self.connected = False
         if self.serial_conn and self.serial_conn.is_open:
             self.serial_conn.close()
-        self.connected = False
+        if self._reader_thread:
+            self._reader_thread.join(timeout=self.RESPONSE_TIMEOUT)
+            self._reader_thread = None
         print("Disconnected from Arduino")
     
     def send_command(self, command: str) -> str:
         """Send command to Arduino and return response"""
+        return self.send_command_async(command).result(self.RESPONSE_TIMEOUT)
+    
+    def send_command_async(self, command: str) -> PendingResponse:
+        """Send command to Arduino without waiting; call result() on the returned reply"""
         if not self.connected:
-            return "ERROR: Not connected to Arduino"
+            return self._failed_response("ERROR: Not connected to Arduino")
+        
+        tag = _RESPONSE_TAGS.get(command.split(',', 1)[0].strip().upper())
+        with self._pending_lock:
+            self._pending_seq += 1
+            pending = PendingResponse(tag, self._pending_seq, self._discard_pending)
+            self._pending.setdefault(tag, deque()).append(pending)
         
         try:
-            # Send command
             self.serial_conn.write(f"{command}\n".encode())
-            
-            # Read response
-            response = ""
-            timeout = time.time() + 2  # 2 second timeout
-            
-            while time.time() < timeout:
-                if self.serial_conn.in_waiting:
-                    line = self.serial_conn.readline().decode().strip()
-                    if line:
-                        response += line + "\n"
-                        if "ERROR" in line or "Target reached" in line:
-                            break
-                time.sleep(0.01)
-            
-            return response.strip()
-            
         except serial.SerialException as e:
             print(f"Serial communication error: {e}")
-            return f"ERROR: {e}"
+            self._discard_pending(pending)
+            return self._failed_response(f"ERROR: {e}")
+        
+        return pending
+    
+    def _failed_response(self, message: str) -> PendingResponse:
+        """Build an already completed reply carrying an error message"""
+        pending = PendingResponse(None)
+        pending.lines.append(message)
+        pending.done.set()
+        return pending
+    
+    def _discard_pending(self, pending: PendingResponse):
+        """Stop routing lines to a reply (completed elsewhere or timed out)"""
+        with self._pending_lock:
+            waiting = self._pending.get(pending.tag)
+            if waiting and pending in waiting:
+                waiting.remove(pending)
+    
+    def _reader_loop(self):
+        """Read Arduino output in the background and dispatch it by response tag"""
+        while self.connected:
+            try:
+                line = self.serial_conn.readline().decode(errors='replace').strip()
+            except (serial.SerialException, OSError, TypeError) as e:
+                if self.connected:
+                    print(f"Serial communication error: {e}")
+                break
+            if line:
+                self._dispatch_line(line)
+    
+    def _dispatch_line(self, line: str):
+        """Append an Arduino output line to the reply waiting for it, if any"""
+        tag = _response_tag(line)
+        with self._pending_lock:
+            if tag == 'ERROR':
+                # Errors answer the oldest outstanding command, whatever its tag
+                waiting_lists = [q for q in self._pending.values() if q]
+                waiting = min(waiting_lists, key=lambda q: q[0].seq) if waiting_lists else None
+            else:
+                waiting = self._pending.get(tag) or self._pending.get(None)
+            if not waiting:
+                self._put_event(tag, line)
+                return
+            pending = waiting[0]
+            pending.lines.append(line)
+            if pending.is_complete(line):
+                waiting.popleft()
+                pending.done.set()
     
     def get_status(self) -> dict:
-        """Get current mount status"""
+        """Get current mount status (reused for STATUS_CACHE_TTL seconds)"""
+        if self._status_cache and time.monotonic() - self._status_ts < self.STATUS_CACHE_TTL:
+            return dict(self._status_cache)
+        
+        self._status_cache = self._read_status()
+        self._status_ts = time.monotonic()
+        return dict(self._status_cache)
+    
+    def _read_status(self) -> dict:
+        """Poll the Arduino for its current status"""
+        if self.compact_status:
+            response = self.send_command("S")
+            if self._parse_compact_status(response):
+                self._pipelining = True
+                return self._status_dict()
+            if "Unknown command 'S'" in response:
+                # Older firmware without the fixed-width command
+                self.compact_status = False
+        
         response = self.send_command("STATUS")
+        self._parse_status_report(response)
         
-        # Parse status response
+        return self._status_dict()
+    
+    def _parse_status_report(self, response: str):
+        """Parse a legacy STATUS report into the tracked position"""
         # Expected format: "STATUS: AZ=100, AL=50, AZ_MOVING=0, AL_MOVING=0"
-        try:
-            if "STATUS:" in response:
-                parts = response.split("STATUS:")[1].strip().split(",")
-                for part in parts:
-                    if "AZ=" in part:
-                        self.current_azimuth_steps = int(part.split("=")[1])
-                    elif "AL=" in part:
-                        self.current_altitude_steps = int(part.split("=")[1])
-                    elif "AZ_MOVING=" in part:
-                        self.azimuth_moving = part.split("=")[1] == "1"
-                    elif "AL_MOVING=" in part:
-                        self.altitude_moving = part.split("=")[1] == "1"
-        except:
-            pass
-        
+        m = _STATUS_RE.search(response)
+        if m:
+            self.current_azimuth_steps, self.current_altitude_steps = int(m[1]), int(m[2])
+            self.azimuth_moving = m[3] == '1'
+            self.altitude_moving = m[4] == '1'
+    
+    def _parse_compact_status(self, response: str) -> bool:
+        """Parse a fixed-width status record: "S+00100+0005001" (AZ, AL, AZ_MOVING, AL_MOVING)"""
+        for line in response.splitlines():
+            if len(line) == 15 and line[0] == 'S':
+                try:
+                    azimuth_steps = int(line[1:7])
+                    altitude_steps = int(line[7:13])
+                except ValueError:
+                    continue
+                self.current_azimuth_steps = azimuth_steps
+                self.current_altitude_steps = altitude_steps
+                self.azimuth_moving = line[13] == '1'
+                self.altitude_moving = line[14] == '1'
+                return True
+        return False
+    
+    def _status_dict(self) -> dict:
+        """Build the status dictionary from the tracked position"""
         return {
             'azimuth_steps': self.current_azimuth_steps,
             'altitude_steps': self.current_altitude_steps,
@@ -136,12 +404,48 @@ class StellariumMountInterface:
             'altitude_degrees': self.steps_to_degrees(self.current_altitude_steps, False)
         }
     
+    def _put_event(self, kind: Optional[str], line: str):
+        """Queue an unsolicited line, dropping the oldest one if nobody is consuming them"""
+        events = self._events.setdefault(kind, queue.Queue(maxsize=EVENT_QUEUE_SIZE))
+        while True:
+            try:
+                events.put_nowait(line)
+                return
+            except queue.Full:
+                try:
+                    events.get_nowait()
+                except queue.Empty:
+                    pass
+    
+    def query_for_event(self, kind: Optional[str], timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Wait for unsolicited Arduino output of the given kind
+        
+        Args:
+            kind: Response tag, e.g. 'AZIMUTH' or 'ALTITUDE' for a "Target reached"
+                that arrived after its command returned, or None for untagged lines
+            timeout: Seconds to wait (None blocks until a line arrives)
+        
+        Returns:
+            The oldest queued line, or None on timeout
+        """
+        with self._pending_lock:
+            events = self._events.setdefault(kind, queue.Queue(maxsize=EVENT_QUEUE_SIZE))
+        try:
+            return events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+    
     def move_azimuth(self, steps: int) -> str:
         """Move azimuth motor to specified step position"""
+        self._status_cache = None
+        self._last_az_cmd = None
         return self.send_command(f"AZ,{steps}")
     
     def move_altitude(self, steps: int) -> str:
         """Move altitude motor to specified step position"""
+        self._status_cache = None
+        self._last_alt_cmd = None
         return self.send_command(f"AL,{steps}")
     
     def move_to_coordinates(self, azimuth_degrees: float, altitude_degrees: float) -> str:
@@ -150,44 +454,96 @@ class StellariumMountInterface:
         azimuth_steps = self.degrees_to_steps(azimuth_degrees, True)
         altitude_steps = self.degrees_to_steps(altitude_degrees, False)
         
-        # Send movement commands
-        az_response = self.move_azimuth(azimuth_steps)
-        al_response = self.move_altitude(altitude_steps)
+        # Skip the serial traffic when the target has not crossed a step boundary
+        if azimuth_steps == self._last_az_cmd and altitude_steps == self._last_alt_cmd:
+            return "No movement: target unchanged"
+        
+        self._status_cache = None
+        if self._pipelining:
+            # Send both movement commands before waiting so the axes' replies overlap
+            az_pending = self.send_command_async(f"AZ,{azimuth_steps}")
+            al_pending = self.send_command_async(f"AL,{altitude_steps}")
+            
+            deadline = time.monotonic() + self.RESPONSE_TIMEOUT
+            az_response = az_pending.result(max(0.0, deadline - time.monotonic()))
+            al_response = al_pending.result(max(0.0, deadline - time.monotonic()))
+        else:
+            # Older sketches merge back-to-back commands into one line and drop
+            # the second, so wait for each reply before sending the next command
+            az_response = self.send_command(f"AZ,{azimuth_steps}")
+            al_response = self.send_command(f"AL,{altitude_steps}")
+        
+        # Only remember targets the axis acknowledged ("... Moving to step N"), so a
+        # failed, dropped or timed-out command is sent again next time
+        self._last_az_cmd = azimuth_steps if _acknowledged(az_response) else None
+        self._last_alt_cmd = altitude_steps if _acknowledged(al_response) else None
         
         return f"Azimuth: {az_response}\nAltitude: {al_response}"
     
     def home_mount(self) -> str:
         """Move mount to home position (0,0)"""
+        self._status_cache = None
+        self._last_az_cmd = self._last_alt_cmd = None
         return self.send_command("HOME")
     
     def stop_mount(self) -> str:
         """Stop all movement"""
+        self._status_cache = None
+        self._last_az_cmd = self._last_alt_cmd = None
         return self.send_command("STOP")
     
     def degrees_to_steps(self, degrees: float, is_azimuth: bool, minutes: float = 0, seconds: float = 0) -> int:
         """Convert degrees, minutes, and seconds to motor steps"""
         total_degrees = degrees + (minutes / 60.0) + (seconds / 3600.0)
-        if is_azimuth:
-            return int((total_degrees / 360.0) * self.AZIMUTH_MAX_STEPS)
-        else:
-            return int((total_degrees / 90.0) * self.ALTITUDE_MAX_STEPS)
+        return int(total_degrees * (self._az_steps_per_deg if is_azimuth else self._alt_steps_per_deg))
+
+    def degrees_to_steps_vec(self, degrees: 'np.ndarray', is_azimuth: bool) -> 'np.ndarray':
+        """Convert an array of decimal degrees to motor steps (e.g. a precomputed slew path)"""
+        _load_numeric()
+        degrees = np.asarray(degrees, dtype=np.float64)
+        scale = self._az_steps_per_deg if is_azimuth else self._alt_steps_per_deg
+        if _deg_to_steps_jit is not None:
+            return _deg_to_steps_jit(np.ascontiguousarray(degrees).ravel(), scale).reshape(degrees.shape)
+        return (degrees * scale).astype(np.int32)
+    
+    def precompute_path(self, path: 'np.ndarray') -> 'np.ndarray':
+        """
+        Convert a slew path to motor steps ahead of time
+        
+        Args:
+            path: Array of shape (N, 2) holding (azimuth, altitude) waypoints in degrees
+        
+        Returns:
+            Array of shape (N, 2) holding (azimuth, altitude) step targets
+        """
+        _load_numeric()
+        path = np.asarray(path, dtype=np.float64)
+        steps = np.empty(path.shape, dtype=np.int32)
+        steps[:, 0] = self.degrees_to_steps_vec(path[:, 0], True)
+        steps[:, 1] = self.degrees_to_steps_vec(path[:, 1], False)
+        return steps
 
     def steps_to_degrees(self, steps: int, is_azimuth: bool) -> tuple:
         """Convert motor steps to (degrees, minutes, seconds) tuple"""
-        if is_azimuth:
-            total_degrees = float(steps) * 360.0 / self.AZIMUTH_MAX_STEPS
-        else:
-            total_degrees = float(steps) * 90.0 / self.ALTITUDE_MAX_STEPS
-        deg = int(total_degrees)
-        min_ = int((total_degrees - deg) * 60)
-        sec = (total_degrees - deg - min_ / 60.0) * 3600.0
-        return (deg, min_, sec)
-    
-    def connect_stellarium(self, host: str = 'localhost', port: int = 10001) -> bool:
-        """Connect to Stellarium's Telescope Control plugin"""
+        total_degrees = steps * (self._az_deg_per_step if is_azimuth else self._alt_deg_per_step)
+        return float_to_dms(total_degrees)
+    
+    def connect_stellarium(self, host: str = 'localhost', port: int = 10001,
+                           socket_options: Optional[list] = None) -> bool:
+        """
+        Connect to Stellarium's Telescope Control plugin
+
+        Args:
+            host: Stellarium host
+            port: Telescope Control plugin port
+            socket_options: List of (level, option, value) tuples applied before
+                connecting (defaults to DEFAULT_SOCKET_OPTIONS, i.e. TCP_NODELAY)
+        """
         try:
             self.stellarium_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            apply_socket_options(self.stellarium_socket, socket_options)
             self.stellarium_socket.connect((host, port))
+            self._stellarium_buf.clear()
             self.stellarium_connected = True
             print(f"Connected to Stellarium on {host}:{port}")
             return True
@@ -204,19 +560,15 @@ class StellariumMountInterface:
         try:
             # Send request for current coordinates
             self.stellarium_socket.send(b"GET_COORDS\n")
+            coords = self._receive_stellarium_coordinates()
             
-            # Read response
-            response = self.stellarium_socket.recv(1024).decode().strip()
-            
-            # Parse coordinates (format: "AZ:123.45,ALT:67.89")
-            if "AZ:" in response and "ALT:" in response:
-                az_part = response.split("AZ:")[1].split(",")[0]
-                alt_part = response.split("ALT:")[1]
-                
-                azimuth = float(az_part)
-                altitude = float(alt_part)
-                
-                return (azimuth, altitude)
+            # A reply without a line ending is complete once the socket goes quiet
+            while coords is None and self._stellarium_buf and self.stellarium_connected:
+                readable, _, _ = select.select([self.stellarium_socket], [], [], STELLARIUM_QUIET_TIME)
+                if not readable:
+                    return self._flush_stellarium_buffer()
+                coords = self._receive_stellarium_coordinates()
+            return coords
             
         except socket.error as e:
             print(f"Error reading from Stellarium: {e}")
@@ -224,6 +576,65 @@ class StellariumMountInterface:
         
         return None
     
+    def _receive_stellarium_coordinates(self) -> Optional[Tuple[float, float]]:
+        """
+        Read from the Stellarium socket and return the newest complete coordinate line
+        
+        Messages can arrive split across reads or several to a read, so bytes
+        are collected until a newline and only complete lines are parsed.
+        Returns None when no complete, valid line has arrived yet; callers pass
+        unterminated replies on with _flush_stellarium_buffer once the socket
+        has been quiet for STELLARIUM_QUIET_TIME.
+        """
+        n = self.stellarium_socket.recv_into(self._rx)
+        if not n:
+            print("Stellarium closed the connection")
+            self.stellarium_connected = False
+            return None
+        
+        buf = self._stellarium_buf
+        buf += self._rx_view[:n]
+        end = buf.rfind(b'\n')
+        if end < 0:
+            if len(buf) > RECV_BUFFER_SIZE:
+                print("Discarding Stellarium data without a line ending")
+                buf.clear()
+            return None
+        lines = bytes(buf[:end]).split(b'\n')
+        del buf[:end + 1]
+        
+        # Only the newest target matters when several arrive together
+        for line in reversed(lines):
+            coords = self._parse_coordinates(str(line, 'utf-8', 'replace').strip())
+            if coords:
+                return coords
+        return None
+    
+    def _flush_stellarium_buffer(self) -> Optional[Tuple[float, float]]:
+        """Parse buffered Stellarium bytes that have no line ending as one message"""
+        if not self._stellarium_buf:
+            return None
+        response = str(bytes(self._stellarium_buf), 'utf-8', 'replace').strip()
+        self._stellarium_buf.clear()
+        return self._parse_coordinates(response)
+    
+    def _parse_coordinates(self, response: str) -> Optional[Tuple[float, float]]:
+        """Parse a Stellarium coordinate reply (format: "AZ:123.45,ALT:67.89")"""
+        if "AZ:" in response and "ALT:" in response:
+            az_part = response.split("AZ:")[1].split(",")[0]
+            alt_part = response.split("ALT:")[1]
+            
+            try:
+                azimuth = float(az_part)
+                altitude = float(alt_part)
+            except ValueError:
+                print(f"Could not parse Stellarium coordinates: {response!r}")
+                return None
+            
+            return (azimuth, altitude)
+        
+        return None
+    
     def auto_track(self, update_interval: float = 1.0):
         """Automatically track Stellarium coordinates"""
         if not self.connected:
@@ -237,62 +648,277 @@ class StellariumMountInterface:
         print("Starting auto-tracking mode...")
         print("Press Ctrl+C to stop")
         
+        # Stellarium's output is the clock: move as soon as coordinates arrive,
+        # and only ask for them when it has been quiet for update_interval
+        deadline = time.monotonic()
         try:
-            while True:
-                coords = self.read_stellarium_coordinates()
+            while self.stellarium_connected:
+                timeout = max(0.0, deadline - time.monotonic())
+                if self._stellarium_buf:
+                    # Partial reply buffered: wait only briefly for its line ending
+                    timeout = min(timeout, STELLARIUM_QUIET_TIME)
+                readable, _, _ = select.select([self.stellarium_socket], [], [], timeout)
+                coords = None
+                if readable:
+                    coords = self._receive_stellarium_coordinates()
+                    deadline = time.monotonic() + update_interval
+                elif self._stellarium_buf:
+                    # Quiet with no line ending: the reply is complete as it stands
+                    coords = self._flush_stellarium_buffer()
+                    deadline = time.monotonic() + update_interval
+                elif time.monotonic() >= deadline:
+                    self.stellarium_socket.send(b"GET_COORDS\n")
+                    deadline = time.monotonic() + update_interval
+                
                 if coords:
                     azimuth, altitude = coords
                     print(f"Target: AZ={azimuth:.2f}°, ALT={altitude:.2f}°")
                     
                     # Move mount to coordinates
                     self.move_to_coordinates(azimuth, altitude)
+            
+            print("Auto-tracking stopped")
+            self.stop_mount()
                 
-                time.sleep(update_interval)
-                
+        except socket.error as e:
+            print(f"Error reading from Stellarium: {e}")
+            self.stellarium_connected = False
+            self.stop_mount()
         except KeyboardInterrupt:
             print("\nAuto-tracking stopped")
             self.stop_mount()
+    
+    async def _probe_firmware_async(self, serial_reader, serial_writer) -> bool:
+        """Send "S" and report whether the Arduino answered with a fixed-width status record"""
+        serial_writer.write(b"S\n")
+        await serial_writer.drain()
+        deadline = time.monotonic() + self.RESPONSE_TIMEOUT
+        try:
+            while True:
+                raw = await asyncio.wait_for(serial_reader.readline(),
+                                             max(0.0, deadline - time.monotonic()))
+                if not raw:
+                    return False
+                line = raw.decode(errors='replace').strip()
+                if self._parse_compact_status(line):
+                    self._pipelining = True
+                    return True
+                if "ERROR" in line:
+                    return False
+        except asyncio.TimeoutError:
+            return False
+        except (OSError, serial.SerialException) as e:
+            print(f"Serial communication error: {e}")
+            return False
+    
+    async def auto_track_async(self, host: str = 'localhost', port: int = 10001,
+                               update_interval: float = 1.0):
+        """
+        Track Stellarium coordinates with overlapping serial and socket I/O
+        
+        Opens its own Arduino and Stellarium connections (do not call
+        connect_arduino first). A status consumer keeps the tracked position
+        up to date from Arduino output while the tracker forwards coordinates,
+        so neither side waits on the other.
+        
+        Args:
+            host: Stellarium host
+            port: Telescope Control plugin port
+            update_interval: Seconds between coordinate requests
+        """
+        if serial_asyncio is None:
+            print("pyserial-asyncio is required for asynchronous auto-tracking")
+            return
+        
+        try:
+            serial_reader, serial_writer = await serial_asyncio.open_serial_connection(
+                url=self.arduino_port, baudrate=self.baud_rate)
+        except serial.SerialException as e:
+            print(f"Failed to connect to Arduino: {e}")
+            return
+        await asyncio.sleep(2)  # Wait for Arduino to reset
+        self.connected = True
+        self._last_az_cmd = self._last_alt_cmd = None
+        print(f"Connected to Arduino on {self.arduino_port}")
+        
+        # The tracker sends AZ, AL and S in one write, which only the sketch that
+        # answers "S" handles (older ones drop all but the first command)
+        if not await self._probe_firmware_async(serial_reader, serial_writer):
+            print("Asynchronous auto-tracking needs the current StellariumMount sketch; please re-upload it")
+            serial_writer.close()
+            self.connected = False
+            return
+        
+        try:
+            coord_reader, coord_writer = await asyncio.open_connection(host, port)
+        except OSError as e:
+            print(f"Failed to connect to Stellarium: {e}")
+            serial_writer.close()
+            self.connected = False
+            return
+        apply_socket_options(coord_writer.get_extra_info('socket'))
+        self.stellarium_connected = True
+        print(f"Connected to Stellarium on {host}:{port}")
+        
+        async def consume_status():
+            try:
+                while True:
+                    raw = await serial_reader.readline()
+                    if not raw:
+                        # EOF (e.g. USB cable unplugged): readline() would return
+                        # immediately forever, so stop instead of spinning
+                        print("Arduino closed the connection")
+                        return
+                    line = raw.decode(errors='replace').strip()
+                    if not self._parse_compact_status(line) and "STATUS:" in line:
+                        self._parse_status_report(line)
+            except (OSError, serial.SerialException) as e:
+                print(f"Serial communication error: {e}")
+        
+        async def track():
+            status_command = b"S\n" if self.compact_status else b"STATUS\n"
+            try:
+                while True:
+                    coord_writer.write(b"GET_COORDS\n")
+                    await coord_writer.drain()
+                    raw = await coord_reader.readline()
+                    if not raw:
+                        print("Stellarium closed the connection")
+                        return
+                    coords = self._parse_coordinates(raw.decode(errors='replace').strip())
+                    if coords:
+                        azimuth, altitude = coords
+                        print(f"Target: AZ={azimuth:.2f}°, ALT={altitude:.2f}°")
+                        
+                        # Move mount to coordinates and request a fresh status, unless
+                        # the target has not crossed a step boundary
+                        azimuth_steps = self.degrees_to_steps(azimuth, True)
+                        altitude_steps = self.degrees_to_steps(altitude, False)
+                        if azimuth_steps != self._last_az_cmd or altitude_steps != self._last_alt_cmd:
+                            # One write for all three commands: the firmware reads one
+                            # command per loop, leaving the rest in its RX buffer
+                            serial_writer.write(f"AZ,{azimuth_steps}\nAL,{altitude_steps}\n".encode() + status_command)
+                            await serial_writer.drain()
+                            self._last_az_cmd, self._last_alt_cmd = azimuth_steps, altitude_steps
+                    
+                    await asyncio.sleep(update_interval)
+            except (OSError, serial.SerialException) as e:
+                print(f"Connection error during auto-tracking: {e}")
+        
+        print("Starting auto-tracking mode...")
+        print("Press Ctrl+C to stop")
+        
+        # Tracking ends as soon as either side closes its connection
+        consumer = asyncio.create_task(consume_status())
+        tracker = asyncio.create_task(track())
+        try:
+            done, _ = await asyncio.wait([consumer, tracker], return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                task.result()
+        finally:
+            print("\nAuto-tracking stopped")
+            consumer.cancel()
+            tracker.cancel()
+            try:
+                serial_writer.write(b"STOP\n")
+                await serial_writer.drain()
+            except (OSError, serial.SerialException):
+                pass  # Port already gone
+            serial_writer.close()
+            coord_writer.close()
+            self.connected = False
+            self.stellarium_connected = False
+
+# Kernels for small waypoint arrays, where NumPy's per-call overhead
+# outweighs the arithmetic. Both take 1-D contiguous arrays; _load_numeric
+# compiles them with numba when it is installed.
+def _deg_to_steps_kernel(deg, scale):
+    out = np.empty(deg.size, np.int32)
+    for i in range(deg.size):
+        out[i] = int(deg[i] * scale)
+    return out
+
+
+def _float_to_dms_kernel(deg_float):
+    deg = np.empty(deg_float.size, np.int32)
+    min_ = np.empty(deg_float.size, np.int32)
+    sec = np.empty(deg_float.size, np.float64)
+    for i in range(deg_float.size):
+        d = int(deg_float[i])
+        rem = (deg_float[i] - d) * 60
+        m = int(rem)
+        deg[i] = d
+        min_[i] = m
+        sec[i] = (rem - m) * 60
+    return deg, min_, sec
+
+
+def _load_numeric():
+    """Import numpy, and compile the batch kernels if numba is installed"""
+    global np, _deg_to_steps_jit, _float_to_dms_jit
+    if np is not None:
+        return
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("numpy is required for batch coordinate conversion") from None
+    try:
+        from numba import njit
+    except ImportError:
+        njit = None
+    if njit is not None:
+        _deg_to_steps_jit = njit(cache=True, fastmath=True)(_deg_to_steps_kernel)
+        _float_to_dms_jit = njit(cache=True)(_float_to_dms_kernel)
+    np = numpy
+
 
 def float_to_dms(deg_float):
-    deg = int(deg_float)
-    min_ = int((deg_float - deg) * 60)
-    sec = (deg_float - deg - min_ / 60.0) * 3600.0
+    # modf truncates toward zero (unlike divmod), so negative angles keep
+    # the sign on every component
+    frac, deg = math.modf(deg_float)
+    sec, min_ = math.modf(frac * 60)
+    return int(deg), int(min_), sec * 60
+
+
+def float_to_dms_vec(deg_float):
+    """Vectorized float_to_dms: returns (degrees, minutes, seconds) arrays"""
+    _load_numeric()
+    deg_float = np.asarray(deg_float, dtype=np.float64)
+    if _float_to_dms_jit is not None:
+        flat = np.ascontiguousarray(deg_float).ravel()
+        return tuple(a.reshape(deg_float.shape) for a in _float_to_dms_jit(flat))
+    deg = deg_float.astype(np.int32)
+    rem = (deg_float - deg) * 60
+    min_ = rem.astype(np.int32)
+    sec = (rem - min_) * 60
     return deg, min_, sec
 
 
+# ASCOM/LX200 command prefixes and their descriptions
+_ASCOM = {
+    ':GR': 'Get Right Ascension (RA)',
+    ':GD': 'Get Declination (Dec)',
+    ':GA': 'Get Azimuth',
+    ':GZ': 'Get Altitude',
+    ':MS': 'Move to position',
+    ':CM': 'Sync to current position',
+    ':Q': 'Stop motion',
+    ':U': 'Move North',
+    ':D': 'Move South',
+    ':L': 'Move East',
+    ':R': 'Move West',
+    # Add more as needed
+}
+
+
 def interpret_ascom_command(cmd):
     cmd = cmd.strip()
-    if cmd.startswith(':GR'):  # Get RA
-        return 'Get Right Ascension (RA)'
-    elif cmd.startswith(':GD'):  # Get Dec
-        return 'Get Declination (Dec)'
-    elif cmd.startswith(':GA'):  # Get Azimuth
-        return 'Get Azimuth'
-    elif cmd.startswith(':GZ'):  # Get Altitude
-        return 'Get Altitude'
-    elif cmd.startswith(':MS'):  # Move to position
-        return 'Move to position'
-    elif cmd.startswith(':Q'):  # Stop
-        return 'Stop motion'
-    elif cmd.startswith(':CM'):  # Sync
-        return 'Sync to current position'
-    elif cmd.startswith(':Q'):  # Stop
-        return 'Stop motion'
-    elif cmd.startswith(':U'):  # Move North
-        return 'Move North'
-    elif cmd.startswith(':D'):  # Move South
-        return 'Move South'
-    elif cmd.startswith(':L'):  # Move East
-        return 'Move East'
-    elif cmd.startswith(':R'):  # Move West
-        return 'Move West'
-    # Add more as needed
-    return None
+    # Three character prefixes take precedence over two character ones
+    return _ASCOM.get(cmd[:3]) or _ASCOM.get(cmd[:2])
 
 def parse_j2000_coords(data_str):
-    import re
     # Try to find two floats (RA, Dec) in the string
-    matches = re.findall(r'([-+]?\d*\.\d+|\d+)', data_str)
+    matches = _FLOAT_RE.findall(data_str)
     if len(matches) >= 2:
         try:
             ra = float(matches[0])
@@ -304,43 +930,161 @@ def parse_j2000_coords(data_str):
             print(f"[DEBUG] Could not parse as floats: {e}")
 
 
-def stellarium_tcp_listener(host='0.0.0.0', port=10001):
+def stellarium_tcp_listener(host='0.0.0.0', port=10001, socket_options=None, workers=1, reuse_port=None):
     print(f"[DEBUG] Starting TCP listener on {host}:{port} for Stellarium (J2000 coordinates)...")
+    # Share the port only when running workers; a lone listener should fail
+    # with EADDRINUSE rather than silently split connections with another process
+    if workers > 1 and platform.system() != 'Linux':
+        # Only Linux balances connections across SO_REUSEPORT sockets; the BSDs and
+        # macOS hand them all to the last socket bound, leaving the other workers idle
+        print("[DEBUG] Listener workers need Linux; using a single listener.")
+        workers = 1
+    if reuse_port is None:
+        reuse_port = workers > 1
+    if reuse_port and not hasattr(socket, 'SO_REUSEPORT'):
+        print("[DEBUG] SO_REUSEPORT is not available on this platform; using a single listener.")
+        reuse_port = False
+        workers = 1
     server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    if reuse_port:
+        # Lets worker processes bind the same port; the kernel spreads connections across them
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    apply_socket_options(server_socket, socket_options)
     server_socket.bind((host, port))
-    server_socket.listen(1)
+    server_socket.listen(128)
+    server_socket.setblocking(False)
     print(f"[DEBUG] Listening for Stellarium connections on port {port}...")
-    try:
+    
+    # Extra workers each run an independent listener on the same port
+    processes = [multiprocessing.Process(target=stellarium_tcp_listener,
+                                         args=(host, port, socket_options, 1, True), daemon=True)
+                 for _ in range(workers - 1)]
+    for process in processes:
+        process.start()
+    rx = bytearray(RECV_BUFFER_SIZE)
+    rx_view = memoryview(rx)
+    
+    # Decoding, parsing and printing happen on a logger thread so the receive
+    # loop never waits on stdout. Items are raw packets (bytes) to decode and
+    # parse, or messages (str) to print; None stops the thread.
+    log_q = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    dropped = 0
+    
+    def log_worker():
         while True:
+            item = log_q.get()
+            if item is None:
+                break
+            if isinstance(item, str):
+                print(item)
+                continue
+            try:
+                data_str = str(item, 'utf-8', 'replace').strip()
+                print(f"[DEBUG] Raw data: {data_str!r}")
+                parse_j2000_coords(data_str)
+            except Exception as e:
+                print(f"[DEBUG] Could not decode or parse data: {e}")
+    
+    logger = threading.Thread(target=log_worker, daemon=True)
+    logger.start()
+    
+    # Multiplex the server and every client on one selector so a second
+    # client (e.g. an ASCOM bridge) is not blocked behind the first
+    sel = selectors.DefaultSelector()
+    sel.register(server_socket, selectors.EVENT_READ)
+    
+    def queue_message(message):
+        # Never block the receive loop: when the logger falls behind, drop instead
+        nonlocal dropped
+        try:
+            log_q.put_nowait(message)
+        except queue.Full:
+            dropped += 1
+    
+    def accept():
+        try:
             client_socket, addr = server_socket.accept()
-            print(f"[DEBUG] Connection from {addr}")
-            with client_socket:
-                while True:
-                    data = client_socket.recv(1024)
-                    if not data:
-                        print(f"[DEBUG] Connection from {addr} closed.")
-                        break
-                    try:
-                        data_str = data.decode('utf-8', errors='replace').strip()
-                        print(f"[DEBUG] Raw data: {data_str!r}")
-                        parse_j2000_coords(data_str)
-                    except Exception as e:
-                        print(f"[DEBUG] Could not decode or parse data: {e}")
+        except (BlockingIOError, InterruptedError):
+            return
+        queue_message(f"[DEBUG] Connection from {addr}")
+        client_socket.setblocking(False)
+        apply_socket_options(client_socket, socket_options)
+        # Each client keeps a buffer of bytes received since its last newline
+        sel.register(client_socket, selectors.EVENT_READ, (addr, bytearray()))
+    
+    def read_client(client_socket, addr, buf):
+        try:
+            n = client_socket.recv_into(rx)
+        except (BlockingIOError, InterruptedError):
+            return
+        except OSError as e:
+            queue_message(f"[DEBUG] Error reading from {addr}: {e}")
+            n = 0
+        if not n:
+            if buf:
+                queue_message(bytes(buf))
+            queue_message(f"[DEBUG] Connection from {addr} closed.")
+            sel.unregister(client_socket)
+            client_socket.close()
+            return
+        
+        # Only complete lines are parsed, so a message split across TCP
+        # segments is handled once instead of once per segment
+        buf += rx_view[:n]
+        while True:
+            idx = buf.find(b'\n')
+            if idx < 0:
+                break
+            queue_message(bytes(buf[:idx]))
+            del buf[:idx + 1]
+        if len(buf) > RECV_BUFFER_SIZE:
+            # Not line-delimited; pass it on rather than growing without bound
+            queue_message(bytes(buf))
+            buf.clear()
+    
+    try:
+        while True:
+            for key, _ in sel.select():
+                if key.fileobj is server_socket:
+                    accept()
+                else:
+                    read_client(key.fileobj, *key.data)
     except KeyboardInterrupt:
-        print("[DEBUG] TCP listener stopped by user.")
+        log_q.put("[DEBUG] TCP listener stopped by user.")
     finally:
-        server_socket.close()
+        for key in list(sel.get_map().values()):
+            key.fileobj.close()
+        sel.close()
+        for process in processes:
+            process.join(timeout=1)
+            if process.is_alive():
+                process.terminate()
+        log_q.put(None)
+        logger.join(timeout=1)
+        if dropped:
+            print(f"[DEBUG] Dropped {dropped} messages while the logger was busy.")
         print("[DEBUG] TCP listener closed.")
 
 def main():
     import argparse
     parser = argparse.ArgumentParser(description="Stellarium Mount Interface")
     parser.add_argument('--listen', action='store_true', help='Start TCP listener for Stellarium debug')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Listener processes sharing the port via SO_REUSEPORT (with --listen, Linux only)')
+    parser.add_argument('--async-track', action='store_true',
+                        help='Auto-track Stellarium with asynchronous I/O (requires pyserial-asyncio)')
     args = parser.parse_args()
 
     if args.listen:
-        stellarium_tcp_listener()
+        stellarium_tcp_listener(workers=args.workers)
+        return
+
+    if args.async_track:
+        try:
+            asyncio.run(StellariumMountInterface().auto_track_async())
+        except KeyboardInterrupt:
+            pass
         return
 
     # Initialize interface
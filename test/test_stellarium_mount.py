@@ -10,6 +10,7 @@ def print_available_commands():
     print("  AZ,<steps>     - Move azimuth motor to step position")
     print("  AL,<steps>     - Move altitude motor to step position")
     print("  STATUS         - Get current position and movement status")
+    print("  S              - Get current position and movement status (fixed-width)")
     print("  HOME           - Move both motors to home position (0,0)")
     print("  STOP           - Stop all movement")
     print("  TEST_AZ        - Test azimuth motor only")
@@ -19,27 +20,32 @@ def print_available_commands():
     print("  HELP           - Show this help message")
     print("  exit           - Exit this script\n")
 
+def print_responses(ser):
+    while True:
+        line = ser.readline()
+        if not line:
+            break
+        print(line.decode(errors='ignore').strip())
+
 def main():
     try:
-        ser = serial.Serial(SERIAL_PORT, BAUD_RATE, timeout=1)
+        # Short read timeout: an empty readline() means the Arduino has gone quiet
+        ser = serial.Serial(SERIAL_PORT, BAUD_RATE, timeout=0.2)
         time.sleep(2)  # Wait for Arduino to reset
         print(f"Connected to {SERIAL_PORT} at {BAUD_RATE} baud.")
         print_available_commands()
         print("Type commands to send to the Arduino. Type 'exit' to quit.\n")
 
         # Read initial Arduino output
-        while ser.in_waiting:
-            print(ser.readline().decode(errors='ignore').strip())
+        print_responses(ser)
 
         while True:
             cmd = input(">>> ")
             if cmd.lower() == 'exit':
                 break
             ser.write((cmd + '\n').encode())
-            time.sleep(0.1)
-            # Read all available lines from Arduino
-            while ser.in_waiting:
-                print(ser.readline().decode(errors='ignore').strip())
+            # Read lines from Arduino as they arrive
+            print_responses(ser)
     except serial.SerialException as e:
         print(f"Serial error: {e}")
     except KeyboardInterrupt: